@@ -7,22 +7,22 @@ import asyncio
 import json
 import logging
 import os
+import random
 import secrets
 import ssl
 import sys
 import time
 import traceback
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, deque
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
 from enum import Enum
 from functools import wraps
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncGenerator, Deque, Dict, List, Mapping, Optional, Tuple, Union
 
 import aiohttp
 import uvicorn
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationError, validator
 
 try:
     from dotenv import load_dotenv
@@ -32,12 +32,37 @@ except ImportError:
 
 try:
     from fastapi import FastAPI, Header, HTTPException, Request, status
+    from fastapi.exceptions import RequestValidationError
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse, StreamingResponse
+    from fastapi.openapi.utils import validation_error_definition, validation_error_response_definition
+    from fastapi.responses import JSONResponse, Response, StreamingResponse
+    from starlette.datastructures import MutableHeaders
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 except ImportError:
     print("ERROR: FastAPI not installed. Run: pip install fastapi uvicorn[standard] aiohttp pydantic", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON."""
+        return orjson.dumps(obj)
+
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    json_loads = json.loads
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is available."""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
 class LogLevel(str, Enum):
     DEBUG = "DEBUG"
     INFO = "INFO"
@@ -57,6 +82,7 @@ class Configuration:
     SERVER_PORT: int
     SERVER_HOST: str
     MAX_WORKERS: int
+    SERVER_WORKERS: int
     REQUEST_TIMEOUT: int
     KEEPALIVE_TIMEOUT: int
     LOG_LEVEL: str
@@ -78,6 +104,7 @@ class Configuration:
         self.SERVER_PORT = self._get_int("PORT", 8000)
         self.SERVER_HOST = self._get_env("HOST", "0.0.0.0")
         self.MAX_WORKERS = self._get_int("MAX_WORKERS", 100)
+        self.SERVER_WORKERS = self._get_int("WORKERS", 1)
         self.REQUEST_TIMEOUT = self._get_int("REQUEST_TIMEOUT", 60)
         self.KEEPALIVE_TIMEOUT = self._get_int("KEEPALIVE_TIMEOUT", 5)
         self.LOG_LEVEL = self._get_env("LOG_LEVEL", "INFO")
@@ -114,6 +141,8 @@ class Configuration:
             raise ValueError("PORT must be between 1 and 65535")
         if self.MAX_WORKERS < 1:
             raise ValueError("MAX_WORKERS must be at least 1")
+        if self.SERVER_WORKERS < 1:
+            raise ValueError("WORKERS must be at least 1")
         if self.REQUEST_TIMEOUT < 1:
             raise ValueError("REQUEST_TIMEOUT must be at least 1")
         if self.LOG_LEVEL not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
@@ -129,16 +158,37 @@ class StructuredLogger:
             handler = logging.StreamHandler(sys.stdout)
             handler.setFormatter(logging.Formatter('%(message)s'))
             self.logger.addHandler(handler)
+        self._timestamp_second = -1
+        self._timestamp_prefix = ""
+        self._emitters = {
+            "DEBUG": (logging.DEBUG, self.logger.debug),
+            "INFO": (logging.INFO, self.logger.info),
+            "WARNING": (logging.WARNING, self.logger.warning),
+            "ERROR": (logging.ERROR, self.logger.error),
+            "CRITICAL": (logging.CRITICAL, self.logger.critical),
+        }
+
+    def _timestamp(self) -> str:
+        """ISO-8601 UTC timestamp; the date/time part is formatted once per second."""
+        now = time.time()
+        second = int(now)
+        if second != self._timestamp_second:
+            self._timestamp_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._timestamp_second = second
+        return f"{self._timestamp_prefix}.{int((now - second) * 1_000_000):06d}+00:00"
 
     def _log(self, level: str, message: str, **kwargs) -> None:
         """Log structured message."""
+        levelno, emit = self._emitters[level]
+        if not self.logger.isEnabledFor(levelno):
+            return
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(),
             "level": level,
             "message": message,
             **kwargs
         }
-        getattr(self.logger, level.lower())(json.dumps(log_entry))
+        emit(json_dumps(log_entry).decode('utf-8'))
 
     def debug(self, message: str, **kwargs) -> None:
         self._log("DEBUG", message, **kwargs)
@@ -156,25 +206,46 @@ class StructuredLogger:
         self._log("CRITICAL", message, **kwargs)
 
 class RateLimiter:
-    """Token bucket rate limiter."""
+    """Sliding window rate limiter."""
     
-    def __init__(self, rate_per_minute: int):
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, rate_per_minute: int, max_clients: int = 100_000):
         self.rate_per_minute = rate_per_minute
-        self.requests: Dict[str, List[float]] = defaultdict(list)
-        self.lock = asyncio.Lock()
+        self.max_clients = max_clients
+        # Least recently seen clients first, so the oldest can be evicted cheaply.
+        self.requests: OrderedDict[str, Deque[float]] = OrderedDict()
+        self._last_prune = time.monotonic()
 
-    async def check_rate_limit(self, key: str) -> bool:
+    def check_rate_limit(self, key: str) -> bool:
         """Check if request is within rate limit."""
-        async with self.lock:
-            now = time.time()
-            window_start = now - 60.0
-            self.requests[key] = [ts for ts in self.requests[key] if ts > window_start]
-            
-            if len(self.requests[key]) >= self.rate_per_minute:
-                return False
-            
-            self.requests[key].append(now)
-            return True
+        now = time.monotonic()
+        window_start = now - self.WINDOW_SECONDS
+        if now - self._last_prune >= self.WINDOW_SECONDS:
+            self._prune(window_start)
+            self._last_prune = now
+
+        timestamps = self.requests.get(key)
+        if timestamps is None:
+            timestamps = self.requests[key] = deque()
+            if len(self.requests) > self.max_clients:
+                self.requests.popitem(last=False)
+        else:
+            self.requests.move_to_end(key)
+            while timestamps and timestamps[0] <= window_start:
+                timestamps.popleft()
+        
+        if len(timestamps) >= self.rate_per_minute:
+            return False
+        
+        timestamps.append(now)
+        return True
+
+    def _prune(self, window_start: float) -> None:
+        """Forget clients whose most recent request fell out of the window."""
+        stale = [key for key, timestamps in self.requests.items() if not timestamps or timestamps[-1] <= window_start]
+        for key in stale:
+            del self.requests[key]
 
 class MetricsCollector:
     """Collect and expose application metrics."""
@@ -184,29 +255,32 @@ class MetricsCollector:
         self.error_count = 0
         self.total_latency = 0.0
         self.streaming_requests = 0
-        self.lock = asyncio.Lock()
 
-    async def record_request(self, latency: float, is_error: bool = False, is_streaming: bool = False) -> None:
-        """Record request metrics."""
-        async with self.lock:
-            self.request_count += 1
-            self.total_latency += latency
-            if is_error:
-                self.error_count += 1
-            if is_streaming:
-                self.streaming_requests += 1
+    def record_request(self, latency: float, is_error: bool = False, is_streaming: bool = False) -> None:
+        """Record request metrics.
+
+        Runs entirely on the event loop thread without awaiting, so plain
+        increments cannot interleave and no lock is needed.
+        """
+        self.request_count += 1
+        self.total_latency += latency
+        self.error_count += is_error
+        self.streaming_requests += is_streaming
 
     async def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics."""
-        async with self.lock:
-            avg_latency = self.total_latency / self.request_count if self.request_count > 0 else 0.0
-            return {
-                "total_requests": self.request_count,
-                "total_errors": self.error_count,
-                "streaming_requests": self.streaming_requests,
-                "average_latency_seconds": round(avg_latency, 3),
-                "error_rate": round(self.error_count / self.request_count, 3) if self.request_count > 0 else 0.0
-            }
+        request_count = self.request_count
+        error_count = self.error_count
+        total_latency = self.total_latency
+        streaming_requests = self.streaming_requests
+        avg_latency = total_latency / request_count if request_count > 0 else 0.0
+        return {
+            "total_requests": request_count,
+            "total_errors": error_count,
+            "streaming_requests": streaming_requests,
+            "average_latency_seconds": round(avg_latency, 3),
+            "error_rate": round(error_count / request_count, 3) if request_count > 0 else 0.0
+        }
 
 # Import persona loading system
 from personas import PersonalityDefinition, load_personas
@@ -239,12 +313,22 @@ class PersonalityRegistry:
     """Registry of available personalities."""
     
     def __init__(self):
-        self.personalities: Dict[str, PersonalityDefinition] = {}
+        self.personalities: Mapping[str, PersonalityDefinition] = {}
+        self.models_response_body = b""
         self._initialize_personalities()
 
     def _initialize_personalities(self) -> None:
         """Initialize all personality definitions by loading from personas directory."""
         self.personalities = load_personas(PRE_INSTRUCTIONS)
+        # Every chat needs the full prompt; read the biographies now so a bad
+        # file fails startup and requests never touch the disk.
+        for personality in self.personalities.values():
+            personality.system_message
+        # Personalities never change after startup, so /v1/models is serialized once.
+        self.models_response_body = json_dumps({
+            "object": "list",
+            "data": self.list_personalities()
+        })
 
     def get_personality(self, personality_id: str) -> Optional[PersonalityDefinition]:
         """Get personality by ID."""
@@ -264,11 +348,15 @@ class HTTPSessionManager:
 
     async def get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
+        session = self.session
+        if session is not None and not session.closed:
+            return session
         async with self.lock:
             if self.session is None or self.session.closed:
                 connector = aiohttp.TCPConnector(
                     limit=self.config.MAX_WORKERS,
-                    limit_per_host=self.config.MAX_WORKERS // 2,
+                    # Every request goes to the same upstream host.
+                    limit_per_host=self.config.MAX_WORKERS,
                     keepalive_timeout=self.config.KEEPALIVE_TIMEOUT,
                     enable_cleanup_closed=True,
                     ssl=False
@@ -281,7 +369,11 @@ class HTTPSessionManager:
                 self.session = aiohttp.ClientSession(
                     connector=connector,
                     timeout=timeout,
-                    headers={"User-Agent": "PersonalityAPI/1.0"}
+                    headers={
+                        "User-Agent": "PersonalityAPI/1.0",
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {self.config.API_KEY}"
+                    }
                 )
             return self.session
 
@@ -290,7 +382,9 @@ class HTTPSessionManager:
         async with self.lock:
             if self.session and not self.session.closed:
                 await self.session.close()
-                await asyncio.sleep(0.1)
+
+# Upstream statuses worth retrying: rate limiting and transient gateway failures.
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
 
 class UpstreamAPIClient:
     """Client for upstream LLM API with retry logic."""
@@ -299,25 +393,60 @@ class UpstreamAPIClient:
         self.config = config
         self.session_manager = session_manager
         self.logger = logger
+        self._chat_url = f"{config.API_URL.rstrip('/')}/chat/completions"
+        self._upstream_model = config.UPSTREAM_MODEL_NAME
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter, so retries do not synchronize."""
+        return random.uniform(0, self.config.RETRY_DELAY * (2 ** attempt))
+
+    def _retry_after_delay(self, response: aiohttp.ClientResponse) -> Optional[float]:
+        """Delay requested by the upstream Retry-After header, if usable."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return None
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            return None
+        return min(max(delay, 0.0), float(self.config.REQUEST_TIMEOUT))
 
     async def _retry_request(self, request_func, max_retries: int = None) -> Any:
-        """Retry request with exponential backoff."""
+        """Retry request on network errors and transient upstream statuses."""
         max_retries = max_retries or self.config.MAX_RETRIES
         last_exception = None
         
         for attempt in range(max_retries):
+            is_last_attempt = attempt == max_retries - 1
             try:
-                return await request_func()
+                response = await request_func()
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 last_exception = e
-                if attempt < max_retries - 1:
-                    delay = self.config.RETRY_DELAY * (2 ** attempt)
+                if not is_last_attempt:
+                    delay = self._backoff_delay(attempt)
                     self.logger.warning(
-                        f"Request failed, retrying in {delay}s",
+                        f"Request failed, retrying in {delay:.2f}s",
                         attempt=attempt + 1,
                         error=str(e)
                     )
                     await asyncio.sleep(delay)
+                continue
+            
+            # Other error statuses (notably 4xx) would fail again, so they are
+            # returned to the caller immediately.
+            if response.status not in RETRYABLE_STATUSES or is_last_attempt:
+                return response
+            
+            delay = self._retry_after_delay(response)
+            if delay is None:
+                delay = self._backoff_delay(attempt)
+            response.release()
+            self.logger.warning(
+                f"Upstream returned {response.status}, retrying in {delay:.2f}s",
+                attempt=attempt + 1,
+                status_code=response.status
+            )
+            await asyncio.sleep(delay)
         
         raise last_exception
 
@@ -328,31 +457,25 @@ class UpstreamAPIClient:
         request_id: str
     ) -> Tuple[Optional[aiohttp.ClientResponse], Optional[Dict[str, Any]]]:
         """Proxy chat completion request to upstream API."""
-        url = f"{self.config.API_URL.rstrip('/')}/chat/completions"
+        url = self._chat_url
         
-        request_data["model"] = self.config.UPSTREAM_MODEL_NAME
+        request_data["model"] = self._upstream_model
         
         messages = request_data.get("messages", [])
-        has_system = any(msg.get("role") == "system" for msg in messages)
         
-        if not has_system:
-            system_message = {
-                "role": "system",
-                "content": personality.system_prompt
-            }
-            messages.insert(0, system_message)
+        # A client-supplied system prompt is expected first, per OpenAI convention.
+        if not messages or messages[0].get("role") != "system":
+            messages.insert(0, personality.system_message)
         
         request_data["messages"] = messages
         
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.config.API_KEY}",
-            "X-Request-ID": request_id
-        }
+        # Content-Type and Authorization are set once on the session.
+        headers = {"X-Request-ID": request_id}
+        body = json_dumps(request_data)
 
         async def make_request():
             session = await self.session_manager.get_session()
-            response = await session.post(url, json=request_data, headers=headers)
+            response = await session.post(url, data=body, headers=headers)
             return response
 
         try:
@@ -361,7 +484,7 @@ class UpstreamAPIClient:
             if response.status >= 400:
                 error_text = await response.text()
                 try:
-                    error_data = json.loads(error_text)
+                    error_data = json_loads(error_text)
                 except json.JSONDecodeError:
                     error_data = {
                         "error": {
@@ -405,51 +528,100 @@ class UpstreamAPIClient:
 class StreamProcessor:
     """Process streaming responses from upstream API."""
     
-    def __init__(self, logger: StructuredLogger):
+    DATA_PREFIX = b"data: "
+    DONE_MARKER = b"[DONE]"
+    DONE_CHUNK = b"data: [DONE]\n\n"
+
+    def __init__(self, logger: StructuredLogger, upstream_model: str):
         self.logger = logger
+        # Upstream chunks normally carry our configured model name verbatim, so
+        # the rewrite can be a plain substring swap instead of a JSON round-trip.
+        encoded_model = json.dumps(upstream_model).encode("utf-8")
+        self._upstream_model_fields = (
+            b'"model":' + encoded_model,
+            b'"model": ' + encoded_model,
+        )
+
+    def _rewrite_model(self, data_content: bytes, requested_model_field: bytes) -> Optional[bytes]:
+        """Swap the upstream model name for the persona ID without decoding JSON.
+
+        Returns None when the chunk does not match the expected layout and
+        must be rewritten the slow way.
+        """
+        if b'"model"' not in data_content:
+            return data_content
+        for field in self._upstream_model_fields:
+            if field in data_content:
+                return data_content.replace(field, requested_model_field, 1)
+        return None
+
+    def _process_line(
+        self,
+        line: bytes,
+        requested_model_id: str,
+        requested_model_field: bytes,
+        request_id: str
+    ) -> bytes:
+        """Rewrite a single SSE line from the upstream stream."""
+        line = line.strip()
+        
+        if not line:
+            return b"\n"
+        
+        if not line.startswith(self.DATA_PREFIX):
+            return line + b"\n\n"
+        
+        data_content = line[6:].strip()
+        
+        if data_content == self.DONE_MARKER:
+            return self.DONE_CHUNK
+        
+        rewritten = self._rewrite_model(data_content, requested_model_field)
+        if rewritten is not None:
+            return self.DATA_PREFIX + rewritten + b"\n\n"
+        
+        try:
+            chunk_data = json_loads(data_content)
+            if "model" in chunk_data:
+                chunk_data["model"] = requested_model_id
+            
+            return self.DATA_PREFIX + json_dumps(chunk_data) + b"\n\n"
+        except json.JSONDecodeError as e:
+            self.logger.warning(
+                "Invalid JSON in stream chunk",
+                request_id=request_id,
+                chunk=data_content[:100].decode("utf-8", errors="replace"),
+                error=str(e)
+            )
+            return line + b"\n\n"
 
     async def process_stream(
         self,
         response: aiohttp.ClientResponse,
         requested_model_id: str,
         request_id: str
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """Process and rewrite streaming response chunks."""
+        requested_model_field = b'"model":' + json_dumps(requested_model_id)
         try:
-            async for line in response.content:
-                if not line:
-                    continue
-                
-                line_str = line.decode('utf-8').strip()
-                
-                if not line_str:
-                    yield "\n"
-                    continue
-                
-                if line_str.startswith("data: "):
-                    data_content = line_str[6:].strip()
-                    
-                    if data_content == "[DONE]":
-                        yield "data: [DONE]\n\n"
-                        break
-                    
-                    try:
-                        chunk_data = json.loads(data_content)
-                        if "model" in chunk_data:
-                            chunk_data["model"] = requested_model_id
-                        
-                        rewritten_line = f"data: {json.dumps(chunk_data, ensure_ascii=False)}\n\n"
-                        yield rewritten_line
-                    except json.JSONDecodeError as e:
-                        self.logger.warning(
-                            "Invalid JSON in stream chunk",
-                            request_id=request_id,
-                            chunk=data_content[:100],
-                            error=str(e)
-                        )
-                        yield line_str + "\n\n"
-                else:
-                    yield line_str + "\n\n"
+            # Split lines ourselves from whatever the transport hands us rather
+            # than paying for a readline() await per SSE line.
+            buffer = bytearray()
+            async for chunk, _ in response.content.iter_chunks():
+                buffer += chunk
+                start = 0
+                while (end := buffer.find(b"\n", start)) != -1:
+                    output = self._process_line(
+                        bytes(buffer[start:end]), requested_model_id, requested_model_field, request_id
+                    )
+                    start = end + 1
+                    yield output
+                    if output is self.DONE_CHUNK:
+                        return
+                del buffer[:start]
+            
+            if buffer:
+                yield self._process_line(bytes(buffer), requested_model_id, requested_model_field, request_id)
                     
         except asyncio.CancelledError:
             self.logger.info("Stream cancelled", request_id=request_id)
@@ -467,7 +639,7 @@ class StreamProcessor:
                     "type": "stream_error"
                 }
             }
-            yield f"data: {json.dumps(error_chunk)}\n\n"
+            yield self.DATA_PREFIX + json_dumps(error_chunk) + b"\n\n"
         finally:
             if not response.closed:
                 response.close()
@@ -479,6 +651,15 @@ class ChatMessage(BaseModel):
     name: Optional[str] = None
     function_call: Optional[Dict[str, Any]] = None
 
+    def to_request_data(self) -> Dict[str, Any]:
+        """Equivalent of model_dump(exclude_none=True) without the serializer overhead."""
+        data = {"role": self.role, "content": self.content}
+        if self.name is not None:
+            data["name"] = self.name
+        if self.function_call is not None:
+            data["function_call"] = self.function_call
+        return data
+
 class ChatCompletionRequest(BaseModel):
     """Chat completion request model."""
     model: str = Field(..., min_length=1)
@@ -503,12 +684,29 @@ class ChatCompletionRequest(BaseModel):
                 raise ValueError("message content cannot be empty")
         return v
 
+    def to_request_data(self) -> Dict[str, Any]:
+        """Same as ChatMessage.to_request_data, for the whole request."""
+        data = {
+            "model": self.model,
+            "messages": [msg.to_request_data() for msg in self.messages]
+        }
+        for field in UPSTREAM_OPTIONAL_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        return data
+
+# Optional ChatCompletionRequest fields forwarded upstream when set.
+UPSTREAM_OPTIONAL_FIELDS = tuple(
+    field for field in ChatCompletionRequest.model_fields if field not in ("model", "messages")
+)
+
 config = Configuration()
 logger = StructuredLogger(__name__, config.LOG_LEVEL)
 personality_registry = PersonalityRegistry()
 session_manager = HTTPSessionManager(config)
 upstream_client = UpstreamAPIClient(config, session_manager, logger)
-stream_processor = StreamProcessor(logger)
+stream_processor = StreamProcessor(logger, config.UPSTREAM_MODEL_NAME)
 rate_limiter = RateLimiter(config.RATE_LIMIT_PER_MINUTE)
 metrics_collector = MetricsCollector()
 
@@ -541,6 +739,7 @@ app = FastAPI(
     description="Production-ready API server with historical personality models",
     version=VERSION,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     docs_url=None,
     redoc_url=None
 )
@@ -553,49 +752,76 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.middleware("http")
-async def request_middleware(request: Request, call_next):
-    """Add request ID and timing to all requests."""
-    request_id = str(uuid.uuid4())
-    request.state.id = request_id
-    start_time = time.time()
-    
-    try:
-        response = await call_next(request)
-        latency = time.time() - start_time
-        
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Process-Time"] = f"{latency:.3f}"
-        
-        is_error = response.status_code >= 400
-        await metrics_collector.record_request(latency, is_error)
+class RequestContextMiddleware:
+    """Add request ID and timing to all requests.
+
+    Implemented as plain ASGI rather than @app.middleware("http"), which
+    pipes every response body chunk through an extra in-memory stream and
+    adds per-chunk overhead to long streaming responses.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        logger.info(
-            "Request completed",
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            latency=round(latency, 3)
-        )
+        request_id = str(uuid.uuid4())
+        state = scope.setdefault("state", {})
+        state["id"] = request_id
+        start_time = time.monotonic()
+        response_started = False
+
+        async def send_with_context(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                latency = time.monotonic() - start_time
+                
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = f"{latency:.3f}"
+                
+                status_code = message["status"]
+                metrics_collector.record_request(
+                    latency,
+                    status_code >= 400,
+                    is_streaming=state.get("is_streaming", False)
+                )
+                
+                logger.info(
+                    "Request completed",
+                    request_id=request_id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    status_code=status_code,
+                    latency=round(latency, 3)
+                )
+            await send(message)
         
-        return response
-    except Exception as e:
-        latency = time.time() - start_time
-        await metrics_collector.record_request(latency, is_error=True)
-        logger.error(
-            "Request failed",
-            request_id=request_id,
-            error=str(e),
-            traceback=traceback.format_exc()
-        )
-        raise
+        try:
+            await self.app(scope, receive, send_with_context)
+        except Exception as e:
+            if not response_started:
+                latency = time.monotonic() - start_time
+                metrics_collector.record_request(latency, is_error=True)
+            logger.error(
+                "Request failed",
+                request_id=request_id,
+                error=str(e),
+                traceback=traceback.format_exc()
+            )
+            raise
+
+app.add_middleware(RequestContextMiddleware)
 
 async def verify_rate_limit(request: Request) -> None:
     """Verify rate limit for request."""
     client_ip = request.client.host if request.client else "unknown"
     
-    if not await rate_limiter.check_rate_limit(client_ip):
+    if not rate_limiter.check_rate_limit(client_ip):
         logger.warning("Rate limit exceeded", client_ip=client_ip, request_id=request.state.id)
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -627,18 +853,50 @@ async def get_metrics():
 @app.get("/v1/models")
 async def list_models():
     """List available personality models."""
-    return {
-        "object": "list",
-        "data": personality_registry.list_personalities()
+    return Response(content=personality_registry.models_response_body, media_type="application/json")
+
+async def parse_chat_request(request: Request) -> ChatCompletionRequest:
+    """Parse and validate the raw request body in a single pydantic-core pass."""
+    body = await request.body()
+    try:
+        return ChatCompletionRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=body
+        )
+
+# The body is parsed by parse_chat_request rather than a typed parameter,
+# so the request schema is declared for OpenAPI by hand.
+CHAT_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {
+            "schema": {"$ref": "#/components/schemas/ChatCompletionRequest"}
+        }
+    }
+}
+
+CHAT_VALIDATION_ERROR_RESPONSE = {
+    "description": "Validation Error",
+    "content": {
+        "application/json": {
+            "schema": {"$ref": "#/components/schemas/HTTPValidationError"}
+        }
     }
+}
 
-@app.post("/v1/chat/completions")
-async def create_chat_completion(
-    request: Request,
-    chat_request: ChatCompletionRequest
-):
+@app.post(
+    "/v1/chat/completions",
+    openapi_extra={
+        "requestBody": CHAT_REQUEST_BODY,
+        "responses": {"422": CHAT_VALIDATION_ERROR_RESPONSE}
+    }
+)
+async def create_chat_completion(request: Request):
     """Create chat completion with personality injection."""
     request_id = request.state.id
+    chat_request = await parse_chat_request(request)
     
     try:
         await verify_rate_limit(request)
@@ -665,7 +923,7 @@ async def create_chat_completion(
             stream=chat_request.stream
         )
         
-        request_data = chat_request.model_dump(exclude_none=True)
+        request_data = chat_request.to_request_data()
         
         response, error = await upstream_client.proxy_chat_completion(
             request_data,
@@ -679,7 +937,8 @@ async def create_chat_completion(
             raise HTTPException(status_code=error_code, detail=error)
         
         if chat_request.stream:
-            await metrics_collector.record_request(0.0, is_streaming=True)
+            # Recorded once by RequestContextMiddleware when the response starts.
+            request.state.is_streaming = True
             return StreamingResponse(
                 stream_processor.process_stream(response, chat_request.model, request_id),
                 media_type="text/event-stream",
@@ -690,10 +949,10 @@ async def create_chat_completion(
                 }
             )
         else:
-            response_data = await response.json()
+            response_data = await response.json(loads=json_loads)
             if "model" in response_data:
                 response_data["model"] = chat_request.model
-            return JSONResponse(content=response_data)
+            return FastJSONResponse(content=response_data)
     
     except HTTPException:
         raise
@@ -715,6 +974,24 @@ async def create_chat_completion(
             }
         )
 
+_default_openapi = app.openapi
+
+def openapi_with_request_models() -> Dict[str, Any]:
+    """OpenAPI schema with the chat request and validation error models added to its components."""
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        request_schema = ChatCompletionRequest.model_json_schema(
+            ref_template="#/components/schemas/{model}"
+        )
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        components.update(request_schema.pop("$defs", {}))
+        components["ChatCompletionRequest"] = request_schema
+        components.setdefault("ValidationError", validation_error_definition)
+        components.setdefault("HTTPValidationError", validation_error_response_definition)
+    return app.openapi_schema
+
+app.openapi = openapi_with_request_models
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
@@ -725,7 +1002,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         error=str(exc),
         traceback=traceback.format_exc()
     )
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": {
@@ -744,13 +1021,18 @@ def main():
             api_url=config.API_URL,
             upstream_model=config.UPSTREAM_MODEL_NAME,
             max_workers=config.MAX_WORKERS,
+            server_workers=config.SERVER_WORKERS,
             rate_limit=config.RATE_LIMIT_PER_MINUTE
         )
         
+        # Worker processes must import the app themselves, which uvicorn only
+        # supports when given an import string.
         uvicorn.run(
-            app,
+            "luminarychat:app" if config.SERVER_WORKERS > 1 else app,
             host=config.SERVER_HOST,
             port=config.SERVER_PORT,
+            workers=config.SERVER_WORKERS,
+            backlog=2048,
             log_level=config.LOG_LEVEL.lower(),
             access_log=False,
             server_header=False,
@@ -1,70 +1,205 @@
 """Persona loading system."""
 
-import importlib
+from __future__ import annotations
+
+import functools
+import importlib.util
+import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from ._registry import PERSONAS
+
+_PACKAGE_DIR = Path(__file__).parent
+
+# Registry entries keyed by persona ID. Loading personas never imports the
+# persona modules themselves; regenerate the registry with
+# tools/bake_personas.py after adding or changing one.
+_PERSONAS_BY_ID = {entry[0]: entry for entry in PERSONAS}
+_PERSONA_MODULES = frozenset(entry[1] for entry in PERSONAS)
+
+
+def _lazy_import(module_path: str):
+    """Import a module whose body only runs on first attribute access."""
+    module = sys.modules.get(module_path)
+    if module is not None:
+        # Bypass module __getattribute__ so a lazy module is not executed here.
+        try:
+            spec = object.__getattribute__(module, "__spec__")
+        except AttributeError:
+            spec = None
+        if spec is not None and not getattr(spec, "_initializing", False):
+            return module
+        # Still being imported (possibly by another thread); let the import
+        # system wait for it to finish.
+        __import__(module_path)
+        return sys.modules[module_path]
+    spec = importlib.util.find_spec(module_path)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {module_path!r}", name=module_path)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_path] = module
+    loader.exec_module(module)
+    return module
+
+
+def __getattr__(name: str):
+    """Import persona modules (e.g. ``personas.confucius``) on first access."""
+    if name in _PERSONA_MODULES:
+        module = _lazy_import(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_PERSONA_MODULES})
+
+
+def iter_persona_ids() -> Iterator[str]:
+    """Iterate over the available persona IDs without importing any persona module."""
+    return iter(_PERSONAS_BY_ID)
 
 
 class PersonalityDefinition:
-    """Historical personality configuration."""
+    """Historical personality configuration.
+    
+    The shared prefix and the biography are stored separately; the full
+    system prompt is only composed when something asks for it. The
+    biography may be given as a path, in which case it is read from disk
+    on first use.
+    """
+    
+    __slots__ = (
+        "id", "created", "owned_by", "_prefix", "_biography", "_biography_path", "_system_message", "_model_dict"
+    )
     
-    def __init__(self, personality_id: str, system_prompt: str, created: int, owned_by: str = "zaguanai"):
+    def __init__(
+        self,
+        personality_id: str,
+        biography: Optional[str] = None,
+        created: int = 0,
+        owned_by: str = "zaguanai",
+        prefix: str = "",
+        biography_path: Optional[Path] = None
+    ):
+        if biography is None and biography_path is None:
+            raise ValueError("Either biography or biography_path must be given")
+        # Interned so lookups keyed by persona ID can match on identity
+        personality_id = sys.intern(personality_id)
+        owned_by = sys.intern(owned_by)
         self.id = personality_id
-        self.system_prompt = system_prompt
         self.created = created
         self.owned_by = owned_by
-
-    def to_model_dict(self) -> Dict[str, Any]:
-        """Convert to OpenAI model format."""
-        return {
-            "id": self.id,
+        self._prefix = prefix
+        self._biography = biography
+        self._biography_path = biography_path
+        self._system_message: Optional[Dict[str, str]] = None
+        self._model_dict = {
+            "id": personality_id,
             "object": "model",
-            "created": self.created,
-            "owned_by": self.owned_by,
+            "created": created,
+            "owned_by": owned_by,
             "permission": [],
-            "root": self.id,
+            "root": personality_id,
             "parent": None
         }
 
+    @property
+    def biography(self) -> str:
+        """Persona biography, read from ``biography_path`` on first access."""
+        if self._biography is None:
+            self._biography = self._biography_path.read_text(encoding="utf-8")
+        return self._biography
+
+    def render_prompt(self) -> str:
+        """Compose the full system prompt from the prefix and biography."""
+        if not self._prefix:
+            return self.biography
+        return "".join((self._prefix, self.biography))
+
+    @property
+    def system_prompt(self) -> str:
+        """Full system prompt; composed on each access, see render_prompt."""
+        return self.render_prompt()
+
+    @property
+    def system_message(self) -> Dict[str, str]:
+        """System message for upstream requests, built on first use.
+        
+        Shared by every request for this personality; never mutate it.
+        """
+        if self._system_message is None:
+            self._system_message = {"role": "system", "content": self.render_prompt()}
+        return self._system_message
+
+    def to_model_dict(self) -> Dict[str, Any]:
+        """Convert to OpenAI model format.
+        
+        The same dict is returned on every call; copy it before modifying.
+        """
+        return self._model_dict
+
 
-def load_personas(pre_instructions: str = "") -> Dict[str, PersonalityDefinition]:
+def load_personas(
+    pre_instructions: str = "",
+    persona_ids: Optional[Iterable[str]] = None
+) -> Mapping[str, PersonalityDefinition]:
     """
-    Load all personas from the personas directory.
+    Load personas from the generated persona registry.
+    
+    Persona modules are not imported; biographies must exist when loading
+    but are only read the first time a persona's prompt is needed. Results
+    are cached per argument combination, so repeated calls return the same
+    read-only mapping.
     
     Args:
         pre_instructions: Common instructions to prepend to all persona biographies
+        persona_ids: Persona IDs to load; all known personas when omitted
         
     Returns:
-        Dictionary mapping persona IDs to PersonalityDefinition objects
+        Read-only mapping of persona IDs to PersonalityDefinition objects
+    
+    Raises:
+        FileNotFoundError: If a persona's biography file is missing
     """
-    personas = {}
-    personas_dir = Path(__file__).parent
+    return _build_personas(pre_instructions, None if persona_ids is None else tuple(persona_ids))
+
+
+@functools.lru_cache(maxsize=None)
+def _build_personas(
+    pre_instructions: str,
+    persona_ids: Optional[Tuple[str, ...]]
+) -> Mapping[str, PersonalityDefinition]:
+    """Build the persona mapping for one set of pre-instructions."""
+    if persona_ids is None:
+        entries = PERSONAS
+    else:
+        entries = [_PERSONAS_BY_ID[persona_id] for persona_id in persona_ids if persona_id in _PERSONAS_BY_ID]
     
-    # Find all Python files in the personas directory (excluding __init__.py)
-    for persona_file in personas_dir.glob("*.py"):
-        if persona_file.name == "__init__.py":
-            continue
-        
-        # Import the module
-        module_name = f"personas.{persona_file.stem}"
-        try:
-            module = importlib.import_module(module_name)
-            
-            # Extract persona attributes
-            persona_id = getattr(module, "PERSONA_ID", None)
-            biography = getattr(module, "BIOGRAPHY", None)
-            created = getattr(module, "CREATED", 0)
-            owned_by = getattr(module, "OWNED_BY", "zaguanai")
-            
-            if persona_id and biography:
-                system_prompt = pre_instructions + biography
-                personas[persona_id] = PersonalityDefinition(
-                    personality_id=persona_id,
-                    system_prompt=system_prompt,
-                    created=created,
-                    owned_by=owned_by
-                )
-        except Exception as e:
-            print(f"Warning: Failed to load persona from {persona_file.name}: {e}")
+    # Biographies are read lazily, so check they exist now rather than on
+    # the first request for the persona.
+    missing = [
+        biography_file for _, _, biography_file, _, _ in entries
+        if not (_PACKAGE_DIR / biography_file).is_file()
+    ]
+    if missing:
+        raise FileNotFoundError(f"Persona biographies not found: {', '.join(missing)}")
     
-    return personas
+    personalities = (
+        PersonalityDefinition(
+            personality_id=persona_id,
+            biography_path=_PACKAGE_DIR / biography_file,
+            created=created,
+            owned_by=owned_by,
+            prefix=pre_instructions
+        )
+        for persona_id, _, biography_file, created, owned_by in entries
+    )
+    return MappingProxyType({personality.id: personality for personality in personalities})
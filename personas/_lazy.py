@@ -0,0 +1,26 @@
+"""Helpers shared by persona modules."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict
+
+
+def lazy_biography(module_globals: Dict[str, Any]) -> Callable[[str], str]:
+    """
+    Build a module-level ``__getattr__`` (PEP 562) exposing ``BIOGRAPHY``.
+
+    The biography is read from the module's ``BIOGRAPHY_PATH`` on first
+    access and stored in the module namespace, so later lookups are plain
+    attribute reads.
+    """
+    def __getattr__(name: str) -> str:
+        if name == "BIOGRAPHY":
+            biography = module_globals["BIOGRAPHY_PATH"].read_text(encoding="utf-8")
+            module_globals["BIOGRAPHY"] = biography
+            return biography
+        raise AttributeError(f"module {module_globals['__name__']!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -0,0 +1,12 @@
+"""
+Persona registry generated by tools/bake_personas.py. Do not edit by hand.
+"""
+
+# (persona ID, module name, biography file relative to this package, created, owned_by)
+PERSONAS = (
+    ("luminary/confucius", "confucius", "data/confucius.md", -76494009960, "zaguanai"),
+    ("luminary/leonardo_da_vinci", "leonardo_da_vinci", "data/leonardo_da_vinci.md", -16337462400, "zaguanai"),
+    ("luminary/marie_curie", "marie_curie", "data/marie_curie.md", -3223584000, "zaguanai"),
+    ("luminary/socrates", "socrates", "data/socrates.md", -76494009960, "zaguanai"),
+    ("luminary/sun_tsu", "sun_tzu", "data/sun_tzu.md", -76494009960, "zaguanai"),
+)
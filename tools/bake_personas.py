@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Generate personas/_registry.py from the persona modules.
+
+The server loads personas from the generated registry instead of
+discovering and importing every persona module at startup. Run this after
+adding a persona or changing a persona's metadata:
+
+    python tools/bake_personas.py          # rewrite personas/_registry.py
+    python tools/bake_personas.py --check  # exit 1 if it is out of date
+"""
+import argparse
+import importlib.util
+import json
+import operator
+import os
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PERSONAS_DIR = ROOT / "personas"
+REGISTRY_PATH = PERSONAS_DIR / "_registry.py"
+
+PERSONA_ATTRS = operator.attrgetter("PERSONA_ID", "BIOGRAPHY_PATH", "CREATED", "OWNED_BY")
+
+HEADER = '''"""
+Persona registry generated by tools/bake_personas.py. Do not edit by hand.
+"""
+
+# (persona ID, module name, biography file relative to this package, created, owned_by)
+PERSONAS = (
+'''
+
+
+def discover_modules():
+    """Names of persona modules in the personas package, in sorted order."""
+    with os.scandir(PERSONAS_DIR) as entries:
+        return sorted(
+            entry.name[:-3] for entry in entries
+            if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()
+        )
+
+
+def load_module(module_name):
+    """Execute a persona module without importing the personas package itself."""
+    if "personas" not in sys.modules:
+        # A bare package lets the modules' relative imports (e.g. ``._lazy``)
+        # resolve without running personas/__init__.py, which needs the
+        # registry this tool generates.
+        package = types.ModuleType("personas")
+        package.__path__ = [str(PERSONAS_DIR)]
+        sys.modules["personas"] = package
+    spec = importlib.util.spec_from_file_location(
+        f"personas.{module_name}", PERSONAS_DIR / f"{module_name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def collect_entries():
+    """Registry entries for every persona module."""
+    entries = []
+    for module_name in discover_modules():
+        module = load_module(module_name)
+        persona_id, biography_path, created, owned_by = PERSONA_ATTRS(module)
+        biography_path = Path(biography_path).resolve()
+        if not biography_path.is_file():
+            raise FileNotFoundError(f"{module_name}: biography not found at {biography_path}")
+        biography_file = biography_path.relative_to(PERSONAS_DIR.resolve()).as_posix()
+        entries.append((persona_id, module_name, biography_file, created, owned_by))
+    return entries
+
+
+def render(entries):
+    """Source of the registry module; strings are written double-quoted."""
+    lines = [HEADER]
+    for entry in entries:
+        fields = ", ".join(json.dumps(value) if isinstance(value, str) else repr(value) for value in entry)
+        lines.append(f"    ({fields}),\n")
+    lines.append(")\n")
+    return "".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only verify the registry is up to date")
+    args = parser.parse_args()
+
+    source = render(collect_entries())
+    current = REGISTRY_PATH.read_text(encoding="utf-8") if REGISTRY_PATH.exists() else None
+
+    if args.check:
+        if source != current:
+            print(f"{REGISTRY_PATH.relative_to(ROOT)} is out of date; run tools/bake_personas.py", file=sys.stderr)
+            return 1
+        return 0
+
+    if source != current:
+        REGISTRY_PATH.write_text(source, encoding="utf-8")
+        print(f"Wrote {REGISTRY_PATH.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())